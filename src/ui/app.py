@@ -84,6 +84,13 @@ def main():
             st.session_state.current_page = page
 
     st.sidebar.markdown("---")
+
+    # Explicit invalidation for the cached directory scans
+    if st.sidebar.button("🔄 Refresh Data", use_container_width=True):
+        from ui.cache import clear_caches
+        clear_caches()
+        st.rerun()
+
     st.sidebar.info(
         "Translation Quality Analysis System\n\n"
         "Measure how spelling errors affect translation quality "
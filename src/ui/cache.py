@@ -0,0 +1,96 @@
+"""
+Shared caching helpers for the UI.
+
+Thin st.cache_data wrappers around the directory-scanning UIConfig methods,
+so widget interactions don't re-walk the results tree and re-parse JSON
+metadata on every rerun.
+"""
+
+import os
+
+import pandas as pd
+import streamlit as st
+
+# Hash DataFrames by content so identical data cached under different
+# paths maps to the same figure entry.
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()
+}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_datasets():
+    """Get available input datasets (cached across reruns)."""
+    return st.session_state.config.get_available_datasets()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_results():
+    """Get available experiment results (cached across reruns)."""
+    return st.session_state.config.get_available_results()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_metrics_files(result_path: str):
+    """Get associated metrics/visualization file paths for a result."""
+    return st.session_state.config.get_metrics_files(result_path)
+
+
+@st.cache_data(show_spinner=False)
+def _load_metrics(path: str, mtime: float):
+    return st.session_state.data_loader.load_metrics(path)
+
+
+@st.cache_data(show_spinner=False)
+def _load_results(path: str, mtime: float):
+    return st.session_state.data_loader.load_results(path)
+
+
+def load_metrics(path: str):
+    """Load a metrics CSV, cached by (path, mtime) so edits invalidate."""
+    return _load_metrics(path, os.path.getmtime(path))
+
+
+def load_results(path: str):
+    """Load a results JSON, cached by (path, mtime) so edits invalidate."""
+    return _load_results(path, os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def build_figure(method: str, df: pd.DataFrame, **kwargs):
+    """
+    Build a visualizer figure, cached by DataFrame content and params.
+
+    Args:
+        method: Name of the InteractiveVisualizer method to call
+        df: Input metrics DataFrame (hashed by content)
+        **kwargs: Forwarded chart parameters
+
+    Returns:
+        Plotly figure object
+    """
+    return getattr(st.session_state.visualizer, method)(df=df, **kwargs)
+
+
+@st.cache_data(show_spinner=False)
+def _summary_stats(path: str, mtime: float, metric: str):
+    col = _load_metrics(path, mtime)[metric]
+    return {
+        'min': float(col.min()),
+        'max': float(col.max()),
+        'mean': float(col.mean()),
+        'median': float(col.median()),
+        'std': float(col.std()),
+        'first': float(col.iloc[0]),
+        'last': float(col.iloc[-1]),
+    }
+
+
+def summary_stats(path: str, metric: str):
+    """Summary statistics for one metric column, cached by (path, mtime)."""
+    return _summary_stats(path, os.path.getmtime(path), metric)
+
+
+def clear_caches():
+    """Invalidate all cached scans (e.g. after running a new experiment)."""
+    st.cache_data.clear()
@@ -4,15 +4,94 @@ Data loading and caching module.
 Handles loading input datasets, experiment results, and metrics.
 """
 
+import functools
 import json
 import logging
+import mmap
 from pathlib import Path
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
+from .schemas import validate_input, validate_results
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow.csv as pacsv
+    import pyarrow.json as pajson
+except ImportError:
+    pacsv = None
+    pajson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Files above this size are memory-mapped instead of read into a buffer
+_MMAP_MIN_SIZE = 65536
+
+# Per-experiment fields repeated on every NDJSON row; hoisted into the
+# metadata sidecar by load_results_ndjson
+_NDJSON_METADATA_COLUMNS = ('experiment_id', 'timestamp', 'mode', 'input_file')
+
+
+def _loads_file(path: Path) -> Dict:
+    """
+    Parse a JSON file, using orjson when available.
+
+    Small files are read into a bytes buffer; files above
+    ``_MMAP_MIN_SIZE`` are memory-mapped so the parser consumes pages
+    straight from the OS cache without a userspace copy. stdlib json is
+    the fallback when orjson isn't installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        ValueError: If the file isn't valid JSON
+    """
+    try:
+        if path.stat().st_size > _MMAP_MIN_SIZE:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is not None:
+                    return orjson.loads(memoryview(mm))
+                return json.loads(bytes(mm))
+
+        with open(path, 'rb') as f:
+            payload = f.read()
+
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON format: {e}")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_json(path: str, mtime: float) -> Dict:
+    """
+    Memoized JSON parse keyed by (path, mtime).
+
+    The mtime key invalidates stale entries when a file is rewritten,
+    and lru_cache bounds memory while sharing parsed payloads across
+    DataLoader instances. Failed parses are not cached.
+
+    Args:
+        path: Path to the JSON file
+        mtime: Modification time of the file at lookup
+
+    Returns:
+        Parsed JSON object
+    """
+    return _loads_file(Path(path))
+
 
 class DataLoader:
     """
@@ -51,19 +130,13 @@ class DataLoader:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Input file not found: {file_path}")
 
-        try:
-            with open(file_path_obj, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            if 'sentences' not in data:
-                raise ValueError("Invalid dataset format: missing 'sentences' key")
+        data = _parse_json(file_path, file_path_obj.stat().st_mtime)
 
-            self._cache[cache_key] = data
-            self.logger.info(f"Loaded dataset: {file_path_obj.name} ({len(data['sentences'])} sentences)")
-            return data
+        validate_input(data)
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {e}")
+        self._cache[cache_key] = data
+        self.logger.info(f"Loaded dataset: {file_path_obj.name} ({len(data['sentences'])} sentences)")
+        return data
 
     def load_results(self, file_path: str) -> Dict:
         """
@@ -89,19 +162,95 @@ class DataLoader:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Results file not found: {file_path}")
 
-        try:
-            with open(file_path_obj, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        data = _parse_json(file_path, file_path_obj.stat().st_mtime)
+
+        validate_results(data)
+
+        self._cache[cache_key] = data
+        self.logger.info(f"Loaded results: {file_path_obj.name} ({len(data['results'])} entries)")
+        return data
+
+    def load_results_summary(self, file_path: str) -> Dict:
+        """
+        Summarize a results file without retaining the full payload.
 
-            if 'results' not in data:
-                raise ValueError("Invalid results format: missing 'results' key")
+        Reuses the cache when the file is already loaded; otherwise the
+        file is parsed outside the memoizing caches, so the payload only
+        lives long enough to project the summary fields and large result
+        files don't stay resident just to show a few headline numbers.
 
-            self._cache[cache_key] = data
-            self.logger.info(f"Loaded results: {file_path_obj.name} ({len(data['results'])} entries)")
-            return data
+        Args:
+            file_path: Path to results JSON file
+
+        Returns:
+            Dictionary with summary statistics
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is invalid
+        """
+        cache_key = f"results_{file_path}"
+
+        if cache_key in self._cache:
+            return self.get_result_summary(self._cache[cache_key])
+
+        file_path_obj = Path(file_path)
+        if not file_path_obj.exists():
+            raise FileNotFoundError(f"Results file not found: {file_path}")
+
+        # Deliberately not _parse_json: memoizing would pin the payload
+        data = _loads_file(file_path_obj)
+
+        validate_results(data)
+
+        return self.get_result_summary(data)
+
+    def load_results_ndjson(self, file_path: str):
+        """
+        Load newline-delimited results (.ndjson/.jsonl) into a DataFrame.
+
+        One result per line lets pyarrow's threaded reader parse lines
+        in parallel and build a columnar table directly, instead of one
+        serial pass over a single JSON blob. Per-experiment fields
+        repeated on every row (experiment_id, timestamp, ...) are
+        hoisted into a metadata sidecar dict and dropped from the frame.
+
+        Args:
+            file_path: Path to .ndjson/.jsonl results file
+
+        Returns:
+            Tuple of (DataFrame of result rows, metadata dict)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If a line isn't valid JSON
+        """
+        file_path_obj = Path(file_path)
+        if not file_path_obj.exists():
+            raise FileNotFoundError(f"Results file not found: {file_path}")
+
+        if pajson is not None:
+            try:
+                df = pajson.read_json(str(file_path_obj)).to_pandas()
+            except Exception as e:
+                raise ValueError(f"Invalid JSON format: {e}")
+        else:
+            with open(file_path_obj, 'rb') as f:
+                try:
+                    rows = [json.loads(line) for line in f if line.strip()]
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON format: {e}")
+            df = pd.DataFrame(rows)
+
+        meta = {
+            column: df[column].iloc[0]
+            for column in _NDJSON_METADATA_COLUMNS
+            if column in df.columns and len(df)
+        }
+        df = df.drop(columns=list(meta))
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {e}")
+        self.logger.info(f"Loaded results: {file_path_obj.name} ({len(df)} entries)")
+        return df, meta
 
     def load_metrics(self, file_path: str) -> pd.DataFrame:
         """
@@ -126,7 +275,12 @@ class DataLoader:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Metrics file not found: {file_path}")
 
-        df = pd.read_csv(file_path_obj)
+        if pacsv is not None:
+            # Multithreaded SIMD CSV parse, handed to pandas zero-copy
+            # where the column types allow it
+            df = pacsv.read_csv(str(file_path_obj)).to_pandas()
+        else:
+            df = pd.read_csv(file_path_obj)
         self._cache[cache_key] = df
         self.logger.info(f"Loaded metrics: {file_path_obj.name} ({len(df)} rows)")
         return df
@@ -146,20 +300,25 @@ class DataLoader:
         if not result_list:
             return {'error': 'No results found'}
 
-        error_rates = [r['error_rate'] for r in result_list]
+        # Pre-sized typed array: one pass, no list or dtype inference
+        n = len(result_list)
+        error_rates = np.fromiter(
+            (r['error_rate'] for r in result_list), dtype=np.float64, count=n
+        )
 
         return {
             'experiment_id': results.get('experiment_id', 'unknown'),
             'timestamp': results.get('timestamp', 'unknown'),
             'mode': results.get('mode', 'unknown'),
             'input_file': results.get('input_file', 'unknown'),
-            'num_sentences': len(result_list),
-            'error_rate_min': min(error_rates),
-            'error_rate_max': max(error_rates),
-            'error_rate_step': error_rates[1] - error_rates[0] if len(error_rates) > 1 else 0
+            'num_sentences': n,
+            'error_rate_min': float(error_rates.min()),
+            'error_rate_max': float(error_rates.max()),
+            'error_rate_step': float(error_rates[1] - error_rates[0]) if n > 1 else 0
         }
 
     def clear_cache(self):
         """Clear all cached data."""
         self._cache.clear()
+        _parse_json.cache_clear()
         self.logger.info("Cache cleared")
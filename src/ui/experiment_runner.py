@@ -32,6 +32,7 @@ class ExperimentRunner:
         self.project_root = Path(project_root)
         self.src_dir = self.project_root / "src"
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._model = None
 
     def prepare_experiment(
         self,
@@ -56,8 +57,10 @@ class ExperimentRunner:
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
+        now = datetime.now()
+
         if output_dir is None:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = now.strftime("%Y-%m-%d")
             output_dir = self.project_root / "results" / date_str / input_path.stem
 
         output_dir = Path(output_dir)
@@ -199,8 +202,12 @@ class ExperimentRunner:
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
+        # Capture the clock once so the output dir, results filename, and
+        # metadata timestamp cannot diverge across a date boundary.
+        now = datetime.now()
+
         if output_dir is None:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = now.strftime("%Y-%m-%d")
             output_dir = self.project_root / "results" / date_str / input_path.stem
 
         output_dir = Path(output_dir)
@@ -253,12 +260,12 @@ class ExperimentRunner:
             })
 
         # Save results
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         results_file = output_dir / f'results_ui_{timestamp}.json'
 
         output_data = {
             'experiment_id': f'ui_experiment_{timestamp}',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'mode': 'ui_automatic_execution',
             'input_file': input_path.name,
             'results': results,
@@ -328,48 +335,52 @@ class ExperimentRunner:
 
         return ""
 
-    def _translate_en_to_fr(self, text: str) -> str:
-        """Translate English to French using Gemini API."""
-        import os
-        import google.generativeai as genai
-        from dotenv import load_dotenv
-
-        load_dotenv()
-        api_key = os.getenv('GOOGLE_API_KEY')
+    def _get_model(self):
+        """
+        Get the shared Gemini model instance.
 
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in .env file")
+        The client is created lazily on first use and reused for every
+        translation call, so the underlying HTTP connection is kept alive
+        across the three chain stages instead of being re-established
+        (env loading, API configuration, TLS setup) per call.
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        Returns:
+            Configured GenerativeModel instance
 
-        prompt = f"""You are a professional English to French translator.
+        Raises:
+            ValueError: If GOOGLE_API_KEY is not configured
+        """
+        if self._model is None:
+            import os
+            import google.generativeai as genai
+            from dotenv import load_dotenv
 
-Translate the following English text to French. The text may contain spelling errors - use context to infer the correct words and produce natural, grammatically correct French.
+            load_dotenv()
+            api_key = os.getenv('GOOGLE_API_KEY')
 
-English text: {text}
+            if not api_key:
+                raise ValueError("GOOGLE_API_KEY not found in .env file")
 
-Provide ONLY the French translation, no explanations."""
+            genai.configure(api_key=api_key)
+            self._model = genai.GenerativeModel('gemini-2.5-flash')
 
-        response = model.generate_content(prompt)
-        return response.text.strip()
+        return self._model
 
-    def _translate_fr_to_he(self, text: str) -> str:
-        """Translate French to Hebrew using Gemini API."""
-        import os
-        import google.generativeai as genai
-        from dotenv import load_dotenv
+    @staticmethod
+    def _en_to_fr_prompt(text: str) -> str:
+        """Build the English-to-French translation prompt."""
+        return f"""You are a professional English to French translator.
 
-        load_dotenv()
-        api_key = os.getenv('GOOGLE_API_KEY')
+Translate the following English text to French. The text may contain spelling errors - use context to infer the correct words and produce natural, grammatically correct French.
 
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in .env file")
+English text: {text}
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+Provide ONLY the French translation, no explanations."""
 
-        prompt = f"""You are a professional French to Hebrew translator.
+    @staticmethod
+    def _fr_to_he_prompt(text: str) -> str:
+        """Build the French-to-Hebrew translation prompt."""
+        return f"""You are a professional French to Hebrew translator.
 
 Translate the following French text to Hebrew. Produce natural, grammatically correct Hebrew with proper syntax.
 
@@ -377,33 +388,64 @@ French text: {text}
 
 Provide ONLY the Hebrew translation, no explanations."""
 
-        response = model.generate_content(prompt)
-        return response.text.strip()
+    @staticmethod
+    def _he_to_en_prompt(text: str) -> str:
+        """Build the Hebrew-to-English translation prompt."""
+        return f"""You are a professional Hebrew to English translator.
 
-    def _translate_he_to_en(self, text: str) -> str:
-        """Translate Hebrew to English using Gemini API."""
-        import os
-        import google.generativeai as genai
-        from dotenv import load_dotenv
+Translate the following Hebrew text to English. Produce natural, grammatically correct English.
 
-        load_dotenv()
-        api_key = os.getenv('GOOGLE_API_KEY')
+Hebrew text: {text}
 
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in .env file")
+Provide ONLY the English translation, no explanations."""
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+    def _stream_translation(self, prompt: str):
+        """
+        Yield translation text chunks from a streaming Gemini response.
 
-        prompt = f"""You are a professional Hebrew to English translator.
+        Stream initiation goes through the same rate-limit retry policy
+        as the batch path, so a transient quota error before the first
+        chunk doesn't abort the whole chain.
 
-Translate the following Hebrew text to English. Produce natural, grammatically correct English.
+        Args:
+            prompt: Translation prompt to send
 
-Hebrew text: {text}
+        Yields:
+            Text chunks as they arrive from the API
+        """
+        response = self._translate_with_retry(
+            lambda p: self._get_model().generate_content(p, stream=True),
+            prompt
+        )
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    def _translate_en_to_fr_stream(self, text: str):
+        """Stream an English-to-French translation chunk by chunk."""
+        yield from self._stream_translation(self._en_to_fr_prompt(text))
+
+    def _translate_fr_to_he_stream(self, text: str):
+        """Stream a French-to-Hebrew translation chunk by chunk."""
+        yield from self._stream_translation(self._fr_to_he_prompt(text))
+
+    def _translate_he_to_en_stream(self, text: str):
+        """Stream a Hebrew-to-English translation chunk by chunk."""
+        yield from self._stream_translation(self._he_to_en_prompt(text))
 
-Provide ONLY the English translation, no explanations."""
+    def _translate_en_to_fr(self, text: str) -> str:
+        """Translate English to French using Gemini API."""
+        response = self._get_model().generate_content(self._en_to_fr_prompt(text))
+        return response.text.strip()
 
-        response = model.generate_content(prompt)
+    def _translate_fr_to_he(self, text: str) -> str:
+        """Translate French to Hebrew using Gemini API."""
+        response = self._get_model().generate_content(self._fr_to_he_prompt(text))
+        return response.text.strip()
+
+    def _translate_he_to_en(self, text: str) -> str:
+        """Translate Hebrew to English using Gemini API."""
+        response = self._get_model().generate_content(self._he_to_en_prompt(text))
         return response.text.strip()
 
     def get_experiment_status(self, output_dir: str) -> Dict:
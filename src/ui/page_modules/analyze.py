@@ -8,6 +8,8 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 
+from .. import cache as ui_cache
+
 
 def render():
     """Render the analyze page."""
@@ -22,7 +24,7 @@ def render():
     runner = st.session_state.experiment_runner
 
     # Get available results
-    results_list = config.get_available_results()
+    results_list = ui_cache.list_results()
 
     if not results_list:
         st.warning("No experiment results found.")
@@ -61,7 +63,7 @@ def render():
     # Load and preview results
     with st.expander("Preview Results"):
         try:
-            results_data = data_loader.load_results(selected_result['path'])
+            results_data = ui_cache.load_results(selected_result['path'])
 
             summary = data_loader.get_result_summary(results_data)
 
@@ -80,7 +82,7 @@ def render():
             return
 
     # Check if metrics already exist
-    metrics_files = config.get_metrics_files(selected_result['path'])
+    metrics_files = ui_cache.get_metrics_files(selected_result['path'])
     metrics_exist = metrics_files['metrics_csv'].exists()
 
     if metrics_exist:
@@ -155,19 +157,23 @@ def render():
         st.subheader("Metrics Summary")
 
         try:
-            metrics_df = data_loader.load_metrics(str(metrics_files['metrics_csv']))
+            metrics_df = ui_cache.load_metrics(str(metrics_files['metrics_csv']))
+
+            # Summary statistics (precomputed once per file version)
+            stats = ui_cache.summary_stats(
+                str(metrics_files['metrics_csv']), 'cosine_distance'
+            )
 
-            # Summary statistics
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("Min Distance", f"{metrics_df['cosine_distance'].min():.4f}")
+                st.metric("Min Distance", f"{stats['min']:.4f}")
             with col2:
-                st.metric("Max Distance", f"{metrics_df['cosine_distance'].max():.4f}")
+                st.metric("Max Distance", f"{stats['max']:.4f}")
             with col3:
-                st.metric("Mean Distance", f"{metrics_df['cosine_distance'].mean():.4f}")
+                st.metric("Mean Distance", f"{stats['mean']:.4f}")
             with col4:
-                total_deg = metrics_df['cosine_distance'].iloc[-1] - metrics_df['cosine_distance'].iloc[0]
+                total_deg = stats['last'] - stats['first']
                 st.metric("Total Degradation", f"{total_deg:.4f}")
 
             # Metrics table
@@ -4,9 +4,21 @@ Comparison page.
 Side-by-side comparison of original and translated texts.
 """
 
+import io
+
 import streamlit as st
 import pandas as pd
 
+from .. import cache as ui_cache
+
+
+@st.cache_data(show_spinner=False)
+def _to_parquet(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to compressed parquet bytes (cached across reruns)."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine='pyarrow', compression='zstd')
+    return buf.getvalue()
+
 
 def render():
     """Render the compare page."""
@@ -21,7 +33,7 @@ def render():
     analyzer = st.session_state.analyzer
 
     # Get available results
-    results_list = config.get_available_results()
+    results_list = ui_cache.list_results()
 
     if not results_list:
         st.warning("No experiment results found.")
@@ -42,13 +54,13 @@ def render():
 
     # Load data
     try:
-        results_data = data_loader.load_results(selected_result['path'])
+        results_data = ui_cache.load_results(selected_result['path'])
         comparison_df = analyzer.create_comparison_dataframe(results_data)
 
         # Load metrics if available
-        metrics_files = config.get_metrics_files(selected_result['path'])
+        metrics_files = ui_cache.get_metrics_files(selected_result['path'])
         if metrics_files['metrics_csv'].exists():
-            metrics_df = data_loader.load_metrics(str(metrics_files['metrics_csv']))
+            metrics_df = ui_cache.load_metrics(str(metrics_files['metrics_csv']))
             # Merge metrics into comparison
             comparison_df = comparison_df.merge(
                 metrics_df[['error_rate', 'cosine_distance', 'cosine_similarity']],
@@ -219,15 +231,31 @@ def render():
             width="stretch"
         )
 
-        # Download option
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            "Download Comparison Data",
-            data=csv,
-            file_name="comparison.csv",
-            mime="text/csv"
+        # Download option (parquet by default: cached, smaller, and much
+        # cheaper to serialize than a CSV string on every rerun)
+        download_format = st.radio(
+            "Download Format",
+            ["Parquet", "CSV"],
+            horizontal=True,
+            key="download_format"
         )
 
+        if download_format == "Parquet":
+            st.download_button(
+                "Download Comparison Data",
+                data=_to_parquet(filtered_df),
+                file_name="comparison.parquet",
+                mime="application/octet-stream"
+            )
+        else:
+            csv = filtered_df.to_csv(index=False)
+            st.download_button(
+                "Download Comparison Data",
+                data=csv,
+                file_name="comparison.csv",
+                mime="text/csv"
+            )
+
     elif view_type == "Text Changes Analysis":
         # Analysis of text changes
         st.subheader("Text Changes Analysis")
@@ -7,6 +7,21 @@ Handles experiment preparation and execution.
 import streamlit as st
 from pathlib import Path
 
+from .. import cache as ui_cache
+
+
+@st.cache_data(show_spinner=False)
+def _load_preview(path: str, mtime: float) -> dict:
+    """Load a dataset for the preview expander, cached by (path, mtime)."""
+    return st.session_state.data_loader.load_input_dataset(path)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _read_prompts(path: str, mtime: float) -> str:
+    """Read the generated prompts file once per version for downloads."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 
 def render():
     """Render the experiment page."""
@@ -20,7 +35,7 @@ def render():
     runner = st.session_state.experiment_runner
 
     # Get available datasets
-    datasets = config.get_available_datasets()
+    datasets = ui_cache.list_datasets()
 
     if not datasets:
         st.warning("No input datasets found in data/input/ directory.")
@@ -54,8 +69,8 @@ def render():
     # Preview dataset
     with st.expander("Preview Dataset"):
         try:
-            data_loader = st.session_state.data_loader
-            data = data_loader.load_input_dataset(selected_dataset['path'])
+            dataset_path = selected_dataset['path']
+            data = _load_preview(dataset_path, Path(dataset_path).stat().st_mtime)
 
             sentences = data.get('sentences', [])
             if sentences:
@@ -85,10 +100,14 @@ def render():
 
     custom_output = None
     if output_location == "Custom directory":
-        custom_output = st.text_input(
-            "Output Directory",
-            value=str(config.results_dir / "custom_experiment")
-        )
+        # Form-wrapped so each keystroke doesn't rerun the whole page
+        # (dataset scan, preview load) — only Apply submits the value.
+        with st.form("custom_output_form"):
+            custom_output = st.text_input(
+                "Output Directory",
+                value=str(config.results_dir / "custom_experiment")
+            )
+            st.form_submit_button("Apply")
 
     # Execution mode
     st.subheader("3. Execution Mode")
@@ -232,8 +251,9 @@ def render():
                     # Provide download for prompts file
                     prompts_path = Path(result['prompts_file'])
                     if prompts_path.exists():
-                        with open(prompts_path, 'r', encoding='utf-8') as f:
-                            prompts_content = f.read()
+                        prompts_content = _read_prompts(
+                            str(prompts_path), prompts_path.stat().st_mtime
+                        )
 
                         st.download_button(
                             label="Download Agent Prompts",
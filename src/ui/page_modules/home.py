@@ -5,9 +5,114 @@ Displays welcome message, system overview, and quick stats.
 """
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 
+from .. import cache as ui_cache
+
+# Import at module load so torch initialization happens once at process
+# start instead of on the first demo click. Guarded so the page still
+# renders when the optional dependency is missing.
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+
+# Single precomputed template for the stage banners in the demo chain,
+# formatted per call instead of re-tokenizing four inline HTML blocks.
+_BANNER_TMPL = (
+    "<div style='background-color:{bg};padding:20px;"
+    "border-radius:10px;margin:10px 0;'>"
+    "<h4 style='margin:0;color:{fg};'>{title}</h4></div>"
+)
+
+
+def _banner(bg: str, fg: str, title: str):
+    """Render a colored stage banner from the shared template."""
+    st.markdown(
+        _BANNER_TMPL.format(bg=bg, fg=fg, title=title),
+        unsafe_allow_html=True
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _get_embedder(model_name: str = "all-MiniLM-L6-v2"):
+    """Load the sentence-transformer model once per worker process."""
+    if SentenceTransformer is None:
+        raise ImportError(
+            "sentence-transformers library not installed. "
+            "Install with: pip install sentence-transformers"
+        )
+    return SentenceTransformer(model_name)
+
+
+# In-process embedding cache keyed by (text, model_name). A plain dict
+# (instead of st.cache_data) lets batch encoding check for misses explicitly.
+_embedding_cache = {}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_disk_cache():
+    """Open the persistent embedding cache once per worker process."""
+    from utils.embedding_cache import EmbeddingCache
+    db_path = st.session_state.config.project_root / ".cache" / "embeddings.db"
+    return EmbeddingCache(str(db_path))
+
+
+def _embed_many(texts, model_name: str = "all-MiniLM-L6-v2", disk_cache=None):
+    """
+    Embed several texts in a single forward pass, reusing cached vectors.
+
+    Misses fall through the in-process dict to the persistent on-disk
+    cache before a forward pass is paid, so embeddings survive restarts.
+
+    Args:
+        texts: List of texts to embed
+        model_name: Sentence-transformer model to use
+        disk_cache: Optional pre-resolved EmbeddingCache. Callers running
+            off the script thread must pass it in: _get_disk_cache reads
+            st.session_state, which only exists on the script thread.
+
+    Returns:
+        List of normalized embedding vectors, one per input text
+    """
+    if disk_cache is None:
+        disk_cache = _get_disk_cache()
+
+    misses = []
+    for text in texts:
+        if (text, model_name) in _embedding_cache:
+            continue
+        cached = disk_cache.get(text, model_name)
+        if cached is not None:
+            _embedding_cache[(text, model_name)] = cached.astype(np.float16)
+        else:
+            misses.append(text)
+
+    if misses:
+        embeddings = _get_embedder(model_name).encode(
+            misses,
+            batch_size=len(misses),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        for text, embedding in zip(misses, embeddings):
+            # Keep fp16 in memory (half the footprint; well within the
+            # .4f display precision) and int8 on disk via the cache.
+            _embedding_cache[(text, model_name)] = embedding.astype(np.float16)
+            disk_cache.put(text, model_name, embedding)
+
+    # Hand back float32 so downstream dot products run at full precision.
+    return [_embedding_cache[(t, model_name)].astype(np.float32) for t in texts]
+
+
+def _embed(text: str, model_name: str = "all-MiniLM-L6-v2",
+           disk_cache=None) -> np.ndarray:
+    """Embed a single text, memoized by (text, model_name) across reruns."""
+    return _embed_many([text], model_name, disk_cache=disk_cache)[0]
+
 
 def render():
     """Render the home page."""
@@ -20,8 +125,71 @@ def render():
     a chain of automated language transformations: **EN → FR → HE → EN**
     """)
 
-    # Interactive Translation Demo
+    # Interactive Translation Demo (isolated so translating doesn't rerun
+    # the rest of the page)
+    st.markdown("---")
+    _demo_fragment()
+
+    # Features section
     st.markdown("---")
+    st.markdown("""
+    #### Features:
+
+    - **Run Experiments**: Execute translation chains on pre-corrupted datasets
+    - **Analyze Results**: Calculate semantic distance metrics (Cosine, Euclidean, Manhattan)
+    - **Visualize Data**: Interactive graphs showing error rate vs semantic distance
+    - **Compare Translations**: Side-by-side comparison of original vs final translations
+
+    #### Quick Start:
+
+    1. Navigate to **Run Experiment** to prepare and execute experiments
+    2. Go to **Analyze Results** to load existing results and calculate metrics
+    3. Use **Visualize Data** for interactive charts and dashboards
+    4. Explore **Compare Translations** for detailed text comparisons
+    """)
+
+    # Display system statistics (isolated: expander toggles here don't
+    # rerun the demo section and vice versa)
+    st.markdown("---")
+    _overview_fragment()
+
+    st.markdown("---")
+
+    # Project information
+    st.subheader("About")
+
+    st.markdown("""
+    This system is part of a research project investigating the robustness
+    of machine translation systems to input noise. By introducing controlled
+    spelling errors and measuring semantic drift through a translation chain,
+    we can quantify translation quality degradation.
+
+    **Technology Stack:**
+    - Python 3.11+
+    - Streamlit for UI
+    - Sentence Transformers for embeddings
+    - Plotly for interactive visualizations
+    - Anthropic Claude for translations
+    """)
+
+    # Quick actions
+    st.markdown("---")
+    st.subheader("Quick Actions")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("Run New Experiment", type="primary", width="stretch"):
+            st.info("👆 Select 'Run Experiment' from the navigation menu above to get started")
+
+    with col2:
+        if st.button("Analyze Results", type="secondary", width="stretch"):
+            st.info("👆 Select 'Analyze Results' from the navigation menu above to view results")
+
+
+@st.fragment
+def _demo_fragment():
+    """Interactive translation demo, rerun independently of the page."""
     st.subheader("🔬 Try it Yourself - Live Translation Demo")
 
     st.markdown("""
@@ -48,35 +216,18 @@ def render():
     elif translate_button and not user_input.strip():
         st.warning("Please enter a sentence to translate.")
 
-    # Features section
-    st.markdown("---")
-    st.markdown("""
-    #### Features:
-
-    - **Run Experiments**: Execute translation chains on pre-corrupted datasets
-    - **Analyze Results**: Calculate semantic distance metrics (Cosine, Euclidean, Manhattan)
-    - **Visualize Data**: Interactive graphs showing error rate vs semantic distance
-    - **Compare Translations**: Side-by-side comparison of original vs final translations
-
-    #### Quick Start:
-
-    1. Navigate to **Run Experiment** to prepare and execute experiments
-    2. Go to **Analyze Results** to load existing results and calculate metrics
-    3. Use **Visualize Data** for interactive charts and dashboards
-    4. Explore **Compare Translations** for detailed text comparisons
-    """)
 
-    # Display system statistics
-    st.markdown("---")
+@st.fragment
+def _overview_fragment():
+    """System overview stats, rerun independently of the demo."""
     st.subheader("System Overview")
 
     config = st.session_state.config
-    data_loader = st.session_state.data_loader
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        datasets = config.get_available_datasets()
+        datasets = ui_cache.list_datasets()
         st.metric("Available Datasets", len(datasets))
 
         if datasets:
@@ -85,7 +236,7 @@ def render():
                     st.write(f"- **{ds['name']}** ({ds['num_sentences']} sentences)")
 
     with col2:
-        results = config.get_available_results()
+        results = ui_cache.list_results()
         st.metric("Experiment Results", len(results))
 
         if results:
@@ -102,39 +253,6 @@ def render():
             for metric in config.distance_metrics:
                 st.write(f"- {metric.replace('_', ' ').title()}")
 
-    st.markdown("---")
-
-    # Project information
-    st.subheader("About")
-
-    st.markdown("""
-    This system is part of a research project investigating the robustness
-    of machine translation systems to input noise. By introducing controlled
-    spelling errors and measuring semantic drift through a translation chain,
-    we can quantify translation quality degradation.
-
-    **Technology Stack:**
-    - Python 3.11+
-    - Streamlit for UI
-    - Sentence Transformers for embeddings
-    - Plotly for interactive visualizations
-    - Anthropic Claude for translations
-    """)
-
-    # Quick actions
-    st.markdown("---")
-    st.subheader("Quick Actions")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        if st.button("Run New Experiment", type="primary", width="stretch"):
-            st.info("👆 Select 'Run Experiment' from the navigation menu above to get started")
-
-    with col2:
-        if st.button("Analyze Results", type="secondary", width="stretch"):
-            st.info("👆 Select 'Analyze Results' from the navigation menu above to view results")
-
 
 def _render_translation_demo(input_text: str):
     """
@@ -145,6 +263,18 @@ def _render_translation_demo(input_text: str):
     """
     runner = st.session_state.experiment_runner
 
+    # Embed the original text in the background while the translation
+    # round-trips are in flight, so the vector is cached by the time the
+    # metrics section needs it. The disk cache is resolved here, on the
+    # script thread — worker threads have no ScriptRunContext, so
+    # st.session_state lookups inside them fail.
+    if '_embed_executor' not in st.session_state:
+        st.session_state._embed_executor = ThreadPoolExecutor(max_workers=2)
+    disk_cache = _get_disk_cache()
+    original_future = st.session_state._embed_executor.submit(
+        _embed, input_text, disk_cache=disk_cache
+    )
+
     # Create container for translation chain
     st.markdown("### 🔄 Translation Chain")
 
@@ -158,60 +288,41 @@ def _render_translation_demo(input_text: str):
         status_text.text("Starting translation chain...")
 
         with st.container():
-            st.markdown("""
-            <div style='background-color: #f0f2f6; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h4 style='margin: 0; color: #1f77b4;'>🇬🇧 Original (English)</h4>
-            </div>
-            """, unsafe_allow_html=True)
+            _banner("#f0f2f6", "#1f77b4", "🇬🇧 Original (English)")
             st.text_area("", value=input_text, height=80, disabled=True, key="demo_original", label_visibility="collapsed")
 
-        # Step 2: EN -> FR
+        # Step 2: EN -> FR (streamed so tokens appear as they arrive)
         progress_bar.progress(25)
         status_text.text("Translating English to French...")
 
-        french = runner._translate_with_retry(runner._translate_en_to_fr, input_text)
-
         with st.container():
-            st.markdown("""
-            <div style='background-color: #e8f4f8; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h4 style='margin: 0; color: #2ca02c;'>🇫🇷 Step 1: French Translation</h4>
-            </div>
-            """, unsafe_allow_html=True)
-            st.text_area("", value=french, height=80, disabled=True, key="demo_french", label_visibility="collapsed")
+            _banner("#e8f4f8", "#2ca02c", "🇫🇷 Step 1: French Translation")
+            french = st.write_stream(runner._translate_en_to_fr_stream(input_text))
+        french = str(french).strip()
 
         # Step 3: FR -> HE
         progress_bar.progress(50)
         status_text.text("Translating French to Hebrew...")
 
-        hebrew = runner._translate_with_retry(runner._translate_fr_to_he, french)
-
         with st.container():
-            st.markdown("""
-            <div style='background-color: #fff4e6; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h4 style='margin: 0; color: #ff7f0e;'>🇮🇱 Step 2: Hebrew Translation</h4>
-            </div>
-            """, unsafe_allow_html=True)
-            st.text_area("", value=hebrew, height=80, disabled=True, key="demo_hebrew", label_visibility="collapsed")
+            _banner("#fff4e6", "#ff7f0e", "🇮🇱 Step 2: Hebrew Translation")
+            hebrew = st.write_stream(runner._translate_fr_to_he_stream(french))
+        hebrew = str(hebrew).strip()
 
         # Step 4: HE -> EN
         progress_bar.progress(75)
         status_text.text("Translating Hebrew back to English...")
 
-        final = runner._translate_with_retry(runner._translate_he_to_en, hebrew)
-
         with st.container():
-            st.markdown("""
-            <div style='background-color: #f0e6ff; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h4 style='margin: 0; color: #9467bd;'>🎯 Final Result (English)</h4>
-            </div>
-            """, unsafe_allow_html=True)
-            st.text_area("", value=final, height=80, disabled=True, key="demo_final", label_visibility="collapsed")
+            _banner("#f0e6ff", "#9467bd", "🎯 Final Result (English)")
+            final = st.write_stream(runner._translate_he_to_en_stream(hebrew))
+        final = str(final).strip()
 
         progress_bar.progress(100)
         status_text.text("Calculating semantic metrics...")
 
         # Calculate metrics
-        _render_metrics(input_text, final)
+        _render_metrics(input_text, final, original_future=original_future)
 
         progress_bar.empty()
         status_text.empty()
@@ -227,18 +338,57 @@ def _render_translation_demo(input_text: str):
             st.code(traceback.format_exc())
 
 
-def _render_metrics(original: str, final: str):
+@st.cache_data(show_spinner=False)
+def _compute_metrics(original: str, final: str,
+                     model_name: str = "all-MiniLM-L6-v2") -> dict:
     """
-    Calculate and display semantic distance metrics.
+    Compute demo distance metrics and word counts, memoized by text pair.
 
     Args:
         original: Original English text
         final: Final English text after translation chain
+        model_name: Sentence-transformer model to use
+
+    Returns:
+        Dictionary with distance values, similarity, and word counts
     """
-    from sentence_transformers import SentenceTransformer
-    from scipy.spatial.distance import cosine, euclidean, cityblock
-    import numpy as np
+    if original.strip() == final.strip():
+        # Identical round-trip (also covers empty strings): all distances
+        # are zero by definition, so skip the model entirely.
+        cosine_dist = euclidean_dist = manhattan_dist = 0.0
+    else:
+        original_embedding, final_embedding = _embed_many(
+            [original, final], model_name
+        )
 
+        # The embeddings are unit-normalized, so cosine distance reduces
+        # to 1 - dot product, and both remaining metrics share a single
+        # difference vector.
+        diff = original_embedding - final_embedding
+        cosine_dist = float(1.0 - original_embedding @ final_embedding)
+        euclidean_dist = float(np.linalg.norm(diff))
+        manhattan_dist = float(np.abs(diff).sum())
+
+    return {
+        'cosine': cosine_dist,
+        'euclidean': euclidean_dist,
+        'manhattan': manhattan_dist,
+        'similarity': (1 - cosine_dist) * 100,
+        'original_words': len(original.split()),
+        'final_words': len(final.split()),
+    }
+
+
+def _render_metrics(original: str, final: str, original_future=None):
+    """
+    Calculate and display semantic distance metrics.
+
+    Args:
+        original: Original English text
+        final: Final English text after translation chain
+        original_future: Optional in-flight future embedding the original
+            text; waited on so the batched encode below hits the cache
+    """
     st.markdown("---")
     st.markdown("### 📊 Semantic Distance Metrics")
 
@@ -252,17 +402,15 @@ def _render_metrics(original: str, final: str):
     """, unsafe_allow_html=True)
 
     with st.spinner("Computing embeddings..."):
-        # Load embedding model
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-
-        # Generate embeddings
-        original_embedding = model.encode(original)
-        final_embedding = model.encode(final)
+        # Wait for the background embedding of the original text (if any),
+        # so the batched encode inside _compute_metrics hits the cache.
+        if original_future is not None:
+            original_future.result()
+        metrics = _compute_metrics(original, final)
 
-        # Calculate distances
-        cosine_dist = cosine(original_embedding, final_embedding)
-        euclidean_dist = euclidean(original_embedding, final_embedding)
-        manhattan_dist = cityblock(original_embedding, final_embedding)
+    cosine_dist = metrics['cosine']
+    euclidean_dist = metrics['euclidean']
+    manhattan_dist = metrics['manhattan']
 
     # Display metrics in columns
     col1, col2, col3 = st.columns(3)
@@ -292,7 +440,7 @@ def _render_metrics(original: str, final: str):
         )
 
     # Similarity score (inverse of cosine distance)
-    similarity = (1 - cosine_dist) * 100
+    similarity = metrics['similarity']
 
     # Visual quality indicator
     st.markdown("### 🎯 Translation Quality Score")
@@ -330,8 +478,8 @@ def _render_metrics(original: str, final: str):
         st.info(final)
 
     # Word count comparison
-    original_words = len(original.split())
-    final_words = len(final.split())
+    original_words = metrics['original_words']
+    final_words = metrics['final_words']
     word_diff = abs(original_words - final_words)
 
     st.markdown(f"""
@@ -4,9 +4,72 @@ Visualization page.
 Interactive charts and graphs for exploring results.
 """
 
+import os
+
 import streamlit as st
 from pathlib import Path
 
+from .. import cache as ui_cache
+
+
+# Figure builders cached by (metrics path, mtime, chart params) so repeat
+# renders of the same chart skip Plotly figure construction entirely.
+# The actual figures are built through ui_cache.build_figure, which keys
+# on DataFrame content — identical data at different paths shares entries.
+
+@st.cache_data(show_spinner=False)
+def _fig_error_vs_distance(path: str, mtime: float, metric: str, title: str):
+    return ui_cache.build_figure(
+        'plot_error_vs_distance',
+        ui_cache.load_metrics(path),
+        metric=metric,
+        title=title
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _fig_multiple_metrics(path: str, mtime: float, metrics: tuple, title: str):
+    return ui_cache.build_figure(
+        'plot_multiple_metrics',
+        ui_cache.load_metrics(path),
+        metrics=list(metrics),
+        title=title
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _key_rates_table(path: str, mtime: float, metrics: tuple,
+                     key_rates: tuple = (0, 10, 25, 50)):
+    """Build the numeric key-rates comparison table with one indexed lookup."""
+    indexed = ui_cache.load_metrics(path).set_index('error_rate')
+    columns = [m for m in metrics if m in indexed.columns]
+
+    subset = indexed.reindex(key_rates).dropna(how='all')[columns]
+    subset.index = [f"{rate:.0f}%" for rate in subset.index]
+    subset.index.name = 'Error Rate'
+    subset.columns = [m.replace('_', ' ').title() for m in columns]
+
+    return subset
+
+
+@st.cache_data(show_spinner=False)
+def _fig_distribution(path: str, mtime: float, metric: str, title: str):
+    return ui_cache.build_figure(
+        'plot_distribution',
+        ui_cache.load_metrics(path),
+        metric=metric,
+        title=title
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _fig_dashboard(path: str, mtime: float, metric: str):
+    return ui_cache.build_figure(
+        'create_dashboard',
+        ui_cache.load_metrics(path),
+        metric=metric
+    )
+
 
 def render():
     """Render the visualize page."""
@@ -17,11 +80,9 @@ def render():
     """)
 
     config = st.session_state.config
-    data_loader = st.session_state.data_loader
-    visualizer = st.session_state.visualizer
 
     # Get results with metrics
-    results_list = config.get_available_results()
+    results_list = ui_cache.list_results()
 
     if not results_list:
         st.warning("No experiment results found.")
@@ -30,7 +91,7 @@ def render():
     # Filter results that have metrics
     results_with_metrics = []
     for res in results_list:
-        metrics_files = config.get_metrics_files(res['path'])
+        metrics_files = ui_cache.get_metrics_files(res['path'])
         if metrics_files['metrics_csv'].exists():
             results_with_metrics.append(res)
 
@@ -53,12 +114,14 @@ def render():
     )
 
     selected_result = result_options[selected_label]
-    metrics_files = config.get_metrics_files(selected_result['path'])
+    metrics_files = ui_cache.get_metrics_files(selected_result['path'])
 
     # Load data
+    metrics_path = str(metrics_files['metrics_csv'])
     try:
-        metrics_df = data_loader.load_metrics(str(metrics_files['metrics_csv']))
-        results_data = data_loader.load_results(selected_result['path'])
+        metrics_mtime = os.path.getmtime(metrics_path)
+        metrics_df = ui_cache.load_metrics(metrics_path)
+        results_data = ui_cache.load_results(selected_result['path'])
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return
@@ -98,29 +161,32 @@ def render():
         if viz_type == "Error Rate vs Distance":
             st.subheader("Error Rate vs Semantic Distance")
 
-            fig = visualizer.plot_error_vs_distance(
-                df=metrics_df,
-                metric=metric,
-                title=f"Translation Degradation - {metric.replace('_', ' ').title()}"
+            fig = _fig_error_vs_distance(
+                metrics_path,
+                metrics_mtime,
+                metric,
+                f"Translation Degradation - {metric.replace('_', ' ').title()}"
             )
 
             st.plotly_chart(fig, width="stretch")
 
-            # Summary statistics
+            # Summary statistics (precomputed once per file version)
+            stats = ui_cache.summary_stats(metrics_path, metric)
+
             col1, col2, col3 = st.columns(3)
 
             with col1:
                 st.metric(
                     "Initial Distance (0% error)",
-                    f"{metrics_df[metric].iloc[0]:.4f}"
+                    f"{stats['first']:.4f}"
                 )
             with col2:
                 st.metric(
                     "Final Distance (50% error)",
-                    f"{metrics_df[metric].iloc[-1]:.4f}"
+                    f"{stats['last']:.4f}"
                 )
             with col3:
-                degradation = metrics_df[metric].iloc[-1] - metrics_df[metric].iloc[0]
+                degradation = stats['last'] - stats['first']
                 st.metric("Total Degradation", f"{degradation:.4f}")
 
         elif viz_type == "Multiple Metrics Comparison":
@@ -130,10 +196,11 @@ def render():
                 st.warning("Please select at least one metric")
                 return
 
-            fig = visualizer.plot_multiple_metrics(
-                df=metrics_df,
-                metrics=metrics_to_plot,
-                title="Comparison of Distance Metrics"
+            fig = _fig_multiple_metrics(
+                metrics_path,
+                metrics_mtime,
+                tuple(metrics_to_plot),
+                "Comparison of Distance Metrics"
             )
 
             st.plotly_chart(fig, width="stretch")
@@ -141,52 +208,46 @@ def render():
             # Comparison table
             st.subheader("Metrics at Key Error Rates")
 
-            key_rates = [0, 10, 25, 50]
-            comparison_data = []
-
-            for rate in key_rates:
-                row = metrics_df[metrics_df['error_rate'] == rate]
-                if not row.empty:
-                    data_point = {'Error Rate': f"{rate}%"}
-                    for m in metrics_to_plot:
-                        if m in row.columns:
-                            data_point[m.replace('_', ' ').title()] = f"{row[m].iloc[0]:.4f}"
-                    comparison_data.append(data_point)
+            comparison_df = _key_rates_table(
+                metrics_path, metrics_mtime, tuple(metrics_to_plot)
+            )
 
-            if comparison_data:
-                import pandas as pd
-                st.table(pd.DataFrame(comparison_data))
+            if not comparison_df.empty:
+                st.dataframe(
+                    comparison_df.style.format("{:.4f}"),
+                    width="stretch"
+                )
 
         elif viz_type == "Distance Distribution":
             st.subheader("Distribution of Distance Values")
 
-            fig = visualizer.plot_distribution(
-                df=metrics_df,
-                metric=metric,
-                title=f"{metric.replace('_', ' ').title()} Distribution"
+            fig = _fig_distribution(
+                metrics_path,
+                metrics_mtime,
+                metric,
+                f"{metric.replace('_', ' ').title()} Distribution"
             )
 
             st.plotly_chart(fig, width="stretch")
 
-            # Statistical summary
+            # Statistical summary (precomputed once per file version)
+            stats = ui_cache.summary_stats(metrics_path, metric)
+
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("Mean", f"{metrics_df[metric].mean():.4f}")
+                st.metric("Mean", f"{stats['mean']:.4f}")
             with col2:
-                st.metric("Median", f"{metrics_df[metric].median():.4f}")
+                st.metric("Median", f"{stats['median']:.4f}")
             with col3:
-                st.metric("Std Dev", f"{metrics_df[metric].std():.4f}")
+                st.metric("Std Dev", f"{stats['std']:.4f}")
             with col4:
-                st.metric("Range", f"{metrics_df[metric].max() - metrics_df[metric].min():.4f}")
+                st.metric("Range", f"{stats['max'] - stats['min']:.4f}")
 
         elif viz_type == "Comprehensive Dashboard":
             st.subheader("Analysis Dashboard")
 
-            fig = visualizer.create_dashboard(
-                df=metrics_df,
-                metric=metric
-            )
+            fig = _fig_dashboard(metrics_path, metrics_mtime, metric)
 
             st.plotly_chart(fig, width="stretch")
 
@@ -0,0 +1,76 @@
+"""
+JSON schemas for the data files the UI loads.
+
+Validators are compiled once at import time with fastjsonschema when it
+is installed — a single C-speed pass over the document instead of
+chained Python ``in`` checks as required keys accrete. Without
+fastjsonschema a minimal key-presence check keeps the identical
+ValueError contract.
+"""
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+INPUT_SCHEMA = {
+    'type': 'object',
+    'required': ['sentences'],
+    'properties': {
+        'sentences': {'type': 'array'},
+        'metadata': {'type': 'object'},
+    },
+}
+
+RESULTS_SCHEMA = {
+    'type': 'object',
+    'required': ['results'],
+    'properties': {
+        'results': {'type': 'array'},
+        'experiment_id': {'type': 'string'},
+        'timestamp': {'type': 'string'},
+    },
+}
+
+
+def _make_validator(schema, message):
+    """
+    Build a validator raising ValueError(message) on schema violations.
+
+    Args:
+        schema: JSON schema dict
+        message: Error message preserving the loader's ValueError text
+
+    Returns:
+        Callable validating a parsed document in place
+    """
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(data):
+            try:
+                compiled(data)
+            except fastjsonschema.JsonSchemaException:
+                raise ValueError(message)
+            return data
+
+        return validate
+
+    required = tuple(schema.get('required', ()))
+
+    def validate(data):
+        for key in required:
+            if key not in data:
+                raise ValueError(message)
+        return data
+
+    return validate
+
+
+validate_input = _make_validator(
+    INPUT_SCHEMA, "Invalid dataset format: missing 'sentences' key"
+)
+validate_results = _make_validator(
+    RESULTS_SCHEMA, "Invalid results format: missing 'results' key"
+)
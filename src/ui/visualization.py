@@ -2,19 +2,149 @@
 Interactive visualization components.
 
 Provides Plotly-based interactive visualizations for the UI.
+
+Plotly itself is imported lazily inside the plot methods: importing it
+costs a few hundred milliseconds, and modules that only need the
+downsampling helpers (or tests that never plot) shouldn't pay for it.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
 from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 
 
 logger = logging.getLogger(__name__)
 
+# Charts get no extra visual fidelity beyond roughly one point per pixel
+# column; larger series are downsampled before handing them to Plotly.
+MAX_PLOT_POINTS = 1000
+
+
+def _lttb_downsample(x, y, n_out: int = MAX_PLOT_POINTS):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previously selected point and the next
+    bucket's average — preserving visual shape while cutting point count.
+
+    Args:
+        x: X values (array-like, assumed sorted)
+        y: Y values (array-like)
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Tuple of (x, y) numpy arrays with at most n_out points
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            selected = lo
+            indices[i + 1] = lo
+            continue
+
+        # Average of the next bucket serves as the third triangle vertex
+        next_hi = edges[i + 2] if i + 2 <= n_out - 2 else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+
+        bucket_x = x[lo:hi]
+        bucket_y = y[lo:hi]
+        areas = np.abs(
+            (x[selected] - avg_x) * (bucket_y - y[selected])
+            - (x[selected] - bucket_x) * (avg_y - y[selected])
+        )
+        selected = lo + int(areas.argmax())
+        indices[i + 1] = selected
+
+    return x[indices], y[indices]
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_plotly_json() -> None:
+    """
+    Point Plotly's JSON serialization at orjson when available.
+
+    orjson formats numbers and numpy arrays in C, several times faster
+    than the stdlib encoder used by to_json/write_html. Memoized so the
+    engine is set once, after plotly's own (lazy) import.
+    """
+    try:
+        import orjson  # noqa: F401
+        import plotly.io as pio
+        pio.json.config.default_engine = 'orjson'
+    except (ImportError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=64)
+def _trend_coeffs_cached(x_bytes: bytes, y_bytes: bytes):
+    """Fit cached by raw array bytes; see _trend_coeffs."""
+    x = np.frombuffer(x_bytes)
+    y = np.frombuffer(y_bytes)
+    # One lstsq dispatch on the Vandermonde matrix; y may be (n,) or
+    # (n, k) to fit several metrics in the same BLAS call. Coefficients
+    # come back highest-degree first, as polyfit's would.
+    coeffs, *_ = np.linalg.lstsq(np.vander(x, 3), y, rcond=None)
+    return coeffs
+
+
+def _trend_coeffs(x, y):
+    """
+    Quadratic trendline coefficients, memoized on array content.
+
+    Streamlit reruns and dashboards refit the same columns repeatedly;
+    hashing the raw bytes is much cheaper than redoing polyfit's least
+    squares, so repeated plots of the same data hit the cache.
+
+    Args:
+        x: X values (array-like)
+        y: Y values (array-like)
+
+    Returns:
+        polyfit coefficient array (highest degree first)
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    return _trend_coeffs_cached(x.tobytes(), y.tobytes())
+
+
+def _binned_histogram(values, bins: int = 15):
+    """
+    Bin values server-side for a bar-based histogram.
+
+    Sends `bins` bar positions to the client instead of shipping every
+    raw value for the browser to bin.
+
+    Args:
+        values: Array-like of values to bin
+        bins: Number of histogram bins
+
+    Returns:
+        Tuple of (bin centers, counts, bin widths) numpy arrays; centers
+        and widths are float32 (display precision)
+    """
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return centers.astype(np.float32), counts, np.diff(edges).astype(np.float32)
+
 
 class InteractiveVisualizer:
     """
@@ -26,8 +156,12 @@ class InteractiveVisualizer:
 
     def __init__(self):
         """Initialize the visualizer."""
+        import plotly.express as px
+
+        _configure_plotly_json()
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.default_colors = px.colors.qualitative.Set2
+        # Tuple: immutable, and hashable if a cache ever keys on it
+        self.default_colors = tuple(px.colors.qualitative.Set2)
 
     def plot_error_vs_distance(
         self,
@@ -46,36 +180,46 @@ class InteractiveVisualizer:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
-
-        error_pct = df['error_rate'] * 100
-
-        # Add line plot
-        fig.add_trace(go.Scatter(
-            x=error_pct,
-            y=df[metric],
+        import plotly.graph_objects as go
+
+        # Convert to numpy once; reused by the trace, downsampler, and fit
+        error_pct = df['error_rate'].to_numpy() * 100.0
+        y_values = df[metric].to_numpy()
+        plot_x, plot_y = _lttb_downsample(error_pct, y_values)
+
+        # Charts only need display precision; float32 halves the bytes
+        # the JSON serializer ships to the browser
+        plot_x = plot_x.astype(np.float32)
+        plot_y = plot_y.astype(np.float32)
+
+        # Collect traces and validate them in one go.Figure construction
+        traces = [go.Scatter(
+            x=plot_x,
+            y=plot_y,
             mode='lines+markers',
             name='Measured Distance',
             line=dict(color='#2E86AB', width=3),
             marker=dict(size=10, color='#2E86AB'),
             hovertemplate='Error Rate: %{x:.0f}%<br>Distance: %{y:.4f}<extra></extra>'
-        ))
+        )]
 
         # Add trendline
         if len(df) >= 3:
-            z = np.polyfit(error_pct, df[metric], 2)
+            z = _trend_coeffs(error_pct, y_values)
             p = np.poly1d(z)
             x_trend = np.linspace(error_pct.min(), error_pct.max(), 100)
 
-            fig.add_trace(go.Scatter(
-                x=x_trend,
-                y=p(x_trend),
+            traces.append(go.Scatter(
+                x=x_trend.astype(np.float32),
+                y=p(x_trend).astype(np.float32),
                 mode='lines',
                 name='Polynomial Fit',
                 line=dict(color='#A23B72', width=2, dash='dash'),
                 hovertemplate='Trend<extra></extra>'
             ))
 
+        fig = go.Figure(data=traces)
+
         fig.update_layout(
             title=title,
             xaxis_title='Spelling Error Rate (%)',
@@ -105,27 +249,54 @@ class InteractiveVisualizer:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
-
-        error_pct = df['error_rate'] * 100
-
-        for i, metric in enumerate(metrics):
-            if metric not in df.columns:
-                continue
-
-            color = self.default_colors[i % len(self.default_colors)]
-
-            fig.add_trace(go.Scatter(
-                x=error_pct,
-                y=df[metric],
-                mode='lines+markers',
-                name=metric.replace('_', ' ').title(),
-                line=dict(color=color, width=2),
-                marker=dict(size=8, color=color),
-                hovertemplate=f'{metric}: %{{y:.4f}}<extra></extra>'
-            ))
+        import plotly.express as px
+
+        columns = set(df.columns)
+        available = [m for m in metrics if m in columns]
+
+        # Build one long-format frame and hand it to px.line in a single
+        # call instead of constructing a go.Scatter per metric. With no
+        # matching metrics the melt branch yields an empty frame (and an
+        # empty figure), whereas concat on zero frames would raise.
+        if available and len(df) > MAX_PLOT_POINTS:
+            error_pct = df['error_rate'].to_numpy() * 100.0
+            frames = []
+            for metric in available:
+                plot_x, plot_y = _lttb_downsample(error_pct, df[metric].to_numpy())
+                frames.append(pd.DataFrame(
+                    {'error_pct': plot_x, 'value': plot_y, 'metric': metric}
+                ))
+            long = pd.concat(frames, ignore_index=True)
+        else:
+            long = df.melt(
+                id_vars=['error_rate'],
+                value_vars=available,
+                var_name='metric',
+                value_name='value'
+            )
+            long['error_pct'] = long['error_rate'] * 100
+
+        # Display precision is enough; halves the serialized payload
+        long = long.astype({'error_pct': np.float32, 'value': np.float32})
+
+        fig = px.line(
+            long,
+            x='error_pct',
+            y='value',
+            color='metric',
+            markers=True,
+            color_discrete_sequence=list(self.default_colors)
+        )
+        fig.update_traces(line=dict(width=2), marker=dict(size=8))
+        for trace in fig.data:
+            raw_name = trace.name
+            trace.update(
+                name=raw_name.replace('_', ' ').title(),
+                hovertemplate=f'{raw_name}: %{{y:.4f}}<extra></extra>'
+            )
 
         fig.update_layout(
+            legend_title_text='',
             title=title,
             xaxis_title='Spelling Error Rate (%)',
             yaxis_title='Distance Value',
@@ -155,14 +326,16 @@ class InteractiveVisualizer:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
+        import plotly.graph_objects as go
 
-        fig.add_trace(go.Histogram(
-            x=df[metric],
-            nbinsx=15,
+        centers, counts, widths = _binned_histogram(df[metric].to_numpy(copy=False))
+        fig = go.Figure(data=[go.Bar(
+            x=centers,
+            y=counts,
+            width=widths,
             name='Distance',
             marker=dict(color='#2E86AB', line=dict(color='black', width=1))
-        ))
+        )])
 
         fig.update_layout(
             title=title,
@@ -190,6 +363,9 @@ class InteractiveVisualizer:
         Returns:
             Plotly figure with subplots
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=(
@@ -198,33 +374,25 @@ class InteractiveVisualizer:
                 'Change in Distance',
                 'Summary Statistics'
             ),
-            specs=[[{'type': 'scatter'}, {'type': 'histogram'}],
+            specs=[[{'type': 'scatter'}, {'type': 'bar'}],
                    [{'type': 'bar'}, {'type': 'table'}]]
         )
 
-        error_pct = df['error_rate'] * 100
+        # Convert to numpy once; every subplot reads from these arrays
+        error_pct = df['error_rate'].to_numpy(copy=False) * 100.0
+        values = df[metric].to_numpy(copy=False)
 
-        # Plot 1: Error vs Distance
-        fig.add_trace(
-            go.Scatter(x=error_pct, y=df[metric], mode='lines+markers',
-                      name='Distance', line=dict(color='#2E86AB')),
-            row=1, col=1
-        )
+        # Plot 1: Error vs Distance (float32: display precision only)
+        plot_x, plot_y = _lttb_downsample(error_pct, values)
+        plot_x = plot_x.astype(np.float32)
+        plot_y = plot_y.astype(np.float32)
 
-        # Plot 2: Distribution
-        fig.add_trace(
-            go.Histogram(x=df[metric], nbinsx=15, name='Distribution',
-                        marker=dict(color='#2E86AB')),
-            row=1, col=2
-        )
+        # Plot 2: Distribution (binned server-side)
+        centers, counts, widths = _binned_histogram(values)
 
         # Plot 3: Changes
-        changes = df[metric].diff().fillna(0)
-        fig.add_trace(
-            go.Bar(x=error_pct, y=changes, name='Change',
-                  marker=dict(color='#A23B72')),
-            row=2, col=1
-        )
+        changes = np.diff(values, prepend=values[:1]).astype(np.float32)
+        error_pct = error_pct.astype(np.float32)
 
         # Plot 4: Statistics table
         stats_data = {
@@ -232,21 +400,31 @@ class InteractiveVisualizer:
                       'Mean Distance', 'Std Distance'],
             'Value': [
                 len(df),
-                f"{df[metric].min():.4f}",
-                f"{df[metric].max():.4f}",
-                f"{df[metric].mean():.4f}",
-                f"{df[metric].std():.4f}"
+                f"{values.min():.4f}",
+                f"{values.max():.4f}",
+                f"{values.mean():.4f}",
+                f"{values.std(ddof=1):.4f}"
             ]
         }
 
-        fig.add_trace(
-            go.Table(
-                header=dict(values=['<b>Metric</b>', '<b>Value</b>'],
-                           fill_color='lightgray'),
-                cells=dict(values=[stats_data['Metric'], stats_data['Value']],
-                          align='left')
-            ),
-            row=2, col=2
+        # One add_traces call validates and appends all subplots at once
+        fig.add_traces(
+            [
+                go.Scatter(x=plot_x, y=plot_y, mode='lines+markers',
+                           name='Distance', line=dict(color='#2E86AB')),
+                go.Bar(x=centers, y=counts, width=widths, name='Distribution',
+                       marker=dict(color='#2E86AB')),
+                go.Bar(x=error_pct, y=changes, name='Change',
+                       marker=dict(color='#A23B72')),
+                go.Table(
+                    header=dict(values=['<b>Metric</b>', '<b>Value</b>'],
+                                fill_color='lightgray'),
+                    cells=dict(values=[stats_data['Metric'], stats_data['Value']],
+                               align='left')
+                ),
+            ],
+            rows=[1, 1, 2, 2],
+            cols=[1, 2, 1, 2]
         )
 
         fig.update_layout(
@@ -7,6 +7,7 @@ This module provides logging, configuration, and cost tracking utilities.
 from .logging_config import setup_logging, get_logger, ExperimentLogger, log_experiment_config
 from .config import Config, load_config
 from .cost_tracker import CostTracker, APICall
+from .embedding_cache import EmbeddingCache
 
 __all__ = [
     "setup_logging",
@@ -17,4 +18,5 @@ __all__ = [
     "load_config",
     "CostTracker",
     "APICall",
+    "EmbeddingCache",
 ]
@@ -5,10 +5,25 @@ This module handles loading and validating configuration from environment variab
 """
 
 import os
+import sys
+from functools import lru_cache
 from typing import Optional, Dict
 from pathlib import Path
+import numpy as np
 from dotenv import load_dotenv
 
+if "streamlit" in sys.modules:
+    # Already running under the UI; reuse its resource cache
+    import streamlit as st
+    _cache_resource = st.cache_resource
+else:
+    # Outside the UI, fall back to a plain process-wide memo without
+    # paying the streamlit import on CLI startup
+    _cache_resource = lru_cache(maxsize=None)
+
+# .env files already parsed this process, keyed by resolved path
+_loaded_env_files = set()
+
 
 class Config:
     """
@@ -40,8 +55,13 @@ class Config:
         if env_file is None:
             env_file = Path(__file__).parent.parent.parent / ".env"
 
-        if Path(env_file).exists():
-            load_dotenv(env_file)
+        # Parse each .env file only once per process; later Config
+        # constructions naming the same file read the already-populated
+        # environment, while a different explicit file still loads.
+        env_path = Path(env_file).resolve()
+        if env_path not in _loaded_env_files and env_path.exists():
+            load_dotenv(env_path)
+            _loaded_env_files.add(env_path)
 
         # API Keys
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -96,7 +116,8 @@ class Config:
                 "Please provide an OpenAI API key or use local embeddings."
             )
 
-        if not all(0.0 <= rate <= 1.0 for rate in self.default_error_rates):
+        rates = np.asarray(self.default_error_rates)
+        if rates.size and ((rates < 0.0) | (rates > 1.0)).any():
             raise ValueError(
                 f"Error rates must be between 0 and 1. Got: {self.default_error_rates}"
             )
@@ -132,10 +153,15 @@ class Config:
         return f"Config({self.to_dict()})"
 
 
+@_cache_resource
 def load_config(env_file: Optional[str] = None) -> Config:
     """
     Load configuration from environment.
 
+    Cached per process (st.cache_resource inside the UI, lru_cache
+    otherwise), so Streamlit reruns reuse one validated Config instead of
+    re-parsing the environment on every render.
+
     Args:
         env_file: Optional path to .env file
 
@@ -5,13 +5,33 @@ This module tracks token usage and calculates costs for LLM API calls.
 """
 
 import logging
+import time
+from array import array
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
+# time_ns readings are UTC; reports convert them back to this zone
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
 
-@dataclass
+
+def _bulk_cost(in_tok, out_tok, in_price, out_price):
+    """Per-row cost for a batch: one fused multiply-add over four arrays."""
+    return in_tok * in_price + out_tok * out_price
+
+
+try:
+    # JIT the kernel when numba is available; the numpy expression above
+    # is already vectorized, so this is a strict optional speedup.
+    from numba import njit
+    _bulk_cost = njit(cache=True, fastmath=True)(_bulk_cost)
+except ImportError:
+    pass
+
+
+@dataclass(slots=True, frozen=True)
 class APICall:
     """
     Data class representing a single API call.
@@ -44,9 +64,13 @@ class CostTracker:
     This class logs all API calls with token counts and calculates costs
     based on model pricing. It can generate reports and aggregate statistics.
 
+    Calls are stored column-oriented (parallel arrays, one per field) rather
+    than as a list of APICall objects, so totals and reports reduce over
+    contiguous numeric buffers instead of touching a Python object per call.
+
     Attributes:
-        calls: List of all API calls made
         pricing: Pricing information for different models
+        num_calls: Number of API calls logged
 
     Example:
         >>> tracker = CostTracker()
@@ -89,6 +113,10 @@ class CostTracker:
         },
     }
 
+    # Fallback pricing for models missing from the table (average rates)
+    FALLBACK_INPUT_PRICE = 3.00 / 1_000_000
+    FALLBACK_OUTPUT_PRICE = 15.00 / 1_000_000
+
     def __init__(self, custom_pricing: Optional[Dict] = None):
         """
         Initialize the cost tracker.
@@ -97,14 +125,46 @@ class CostTracker:
             custom_pricing: Optional custom pricing dictionary
                            Format: {"model_name": {"input": price, "output": price}}
         """
-        self.calls: List[APICall] = []
+        self._columns = self._empty_columns()
+        self._df_cache: Optional[pd.DataFrame] = None
         self.pricing = {**self.DEFAULT_PRICING}
 
         if custom_pricing:
             self.pricing.update(custom_pricing)
 
+        # Flat pricing lookup for the fast path: model_to_id maps a model
+        # name to an index into the per-token price arrays.
+        self.model_to_id = {m: i for i, m in enumerate(self.pricing)}
+        self._model_names = list(self.pricing)
+        self._in_price_arr = array(
+            'd', (p["input"] for p in self.pricing.values())
+        )
+        self._out_price_arr = array(
+            'd', (p["output"] for p in self.pricing.values())
+        )
+
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @staticmethod
+    def _empty_columns() -> Dict[str, list]:
+        """Build fresh per-field storage (numeric fields as typed arrays)."""
+        return {
+            # Raw clock reads; materialized as datetimes only in reports
+            'timestamp_ns': array('q'),
+            'agent': [],
+            'model': [],
+            'input_tokens': array('q'),
+            'output_tokens': array('q'),
+            'cost': array('d'),
+            'experiment_id': [],
+            'duration_seconds': [],
+        }
+
+    @property
+    def num_calls(self) -> int:
+        """Number of API calls logged so far."""
+        return len(self._columns['agent'])
+
     def log_call(
         self,
         agent: str,
@@ -136,26 +196,163 @@ class CostTracker:
 
         cost = self._calculate_cost(model, input_tokens, output_tokens)
 
-        call = APICall(
-            timestamp=datetime.now(),
-            agent=agent,
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost=cost,
-            experiment_id=experiment_id,
-            duration_seconds=duration_seconds,
-        )
+        cols = self._columns
+        cols['timestamp_ns'].append(time.time_ns())
+        cols['agent'].append(agent)
+        cols['model'].append(model)
+        cols['input_tokens'].append(input_tokens)
+        cols['output_tokens'].append(output_tokens)
+        cols['cost'].append(cost)
+        cols['experiment_id'].append(experiment_id)
+        cols['duration_seconds'].append(duration_seconds)
 
-        self.calls.append(call)
+        self._df_cache = None
 
+        # Lazy %-style args so no string is built when DEBUG is filtered
         self.logger.debug(
-            f"Logged API call: {agent} | {model} | "
-            f"tokens: {input_tokens}+{output_tokens} | cost: ${cost:.4f}"
+            "Logged API call: %s | %s | tokens: %d+%d | cost: $%.4f",
+            agent, model, input_tokens, output_tokens, cost
         )
 
         return cost
 
+    def log_call_fast(
+        self,
+        agent: str,
+        model_id: int,
+        input_tokens: int,
+        output_tokens: int,
+        experiment_id: Optional[str] = None,
+    ) -> float:
+        """
+        Minimal hot-path variant of log_call.
+
+        Skips validation, debug logging, and the pricing dict: the caller
+        resolves the model once via `model_to_id` and passes the integer
+        id, leaving only typed-array appends and two multiply-adds.
+
+        Args:
+            agent: Name of the agent making the call
+            model_id: Index from `model_to_id` for the model used
+            input_tokens: Number of input tokens
+            output_tokens: Number of output tokens
+            experiment_id: Optional experiment identifier
+
+        Returns:
+            Cost of this call in USD
+        """
+        cost = (input_tokens * self._in_price_arr[model_id]
+                + output_tokens * self._out_price_arr[model_id])
+
+        cols = self._columns
+        cols['timestamp_ns'].append(time.time_ns())
+        cols['agent'].append(agent)
+        cols['model'].append(self._model_names[model_id])
+        cols['input_tokens'].append(input_tokens)
+        cols['output_tokens'].append(output_tokens)
+        cols['cost'].append(cost)
+        cols['experiment_id'].append(experiment_id)
+        cols['duration_seconds'].append(None)
+
+        self._df_cache = None
+        return cost
+
+    def log_calls_batch(
+        self,
+        agents,
+        models,
+        input_tokens,
+        output_tokens,
+        experiment_ids=None,
+        durations_seconds=None,
+    ) -> np.ndarray:
+        """
+        Log many API calls at once with vectorized cost calculation.
+
+        Pricing is resolved through a categorical code lookup into flat
+        price arrays, so the per-row nested dict indexing of log_call is
+        replaced by one numpy multiply-add over the whole batch.
+
+        Args:
+            agents: Sequence of agent names
+            models: Sequence of model identifiers
+            input_tokens: Sequence of input token counts
+            output_tokens: Sequence of output token counts
+            experiment_ids: Optional sequence of experiment identifiers
+            durations_seconds: Optional sequence of call durations
+
+        Returns:
+            Array of per-call costs in USD
+
+        Raises:
+            ValueError: If token counts are negative or sequence lengths
+                don't match
+        """
+        input_tokens = np.asarray(input_tokens, dtype=np.int64)
+        output_tokens = np.asarray(output_tokens, dtype=np.int64)
+
+        if (input_tokens < 0).any() or (output_tokens < 0).any():
+            raise ValueError("Token counts cannot be negative")
+
+        # Reject mismatched inputs before any column is extended, so a
+        # bad batch can't desync the columnar store.
+        n = len(input_tokens)
+        lengths = {
+            'agents': len(agents),
+            'models': len(models),
+            'output_tokens': len(output_tokens),
+        }
+        if experiment_ids is not None:
+            lengths['experiment_ids'] = len(experiment_ids)
+        if durations_seconds is not None:
+            lengths['durations_seconds'] = len(durations_seconds)
+        mismatched = [name for name, length in lengths.items() if length != n]
+        if mismatched:
+            raise ValueError(
+                f"Batch sequences must match len(input_tokens)={n}; "
+                f"mismatched: {', '.join(mismatched)}"
+            )
+        categories = list(self.pricing)
+        codes = pd.Categorical(models, categories=categories).codes
+        input_prices = np.array([self.pricing[m]["input"] for m in categories])
+        output_prices = np.array([self.pricing[m]["output"] for m in categories])
+
+        known = codes >= 0
+        if not known.all():
+            self.logger.warning(
+                f"{int((~known).sum())} call(s) use models not in pricing "
+                f"table. Using default pricing."
+            )
+
+        safe_codes = np.where(known, codes, 0)
+        in_price = np.where(known, input_prices[safe_codes],
+                            self.FALLBACK_INPUT_PRICE)
+        out_price = np.where(known, output_prices[safe_codes],
+                             self.FALLBACK_OUTPUT_PRICE)
+        costs = _bulk_cost(input_tokens, output_tokens, in_price, out_price)
+
+        cols = self._columns
+        cols['timestamp_ns'].extend([time.time_ns()] * n)
+        cols['agent'].extend(agents)
+        cols['model'].extend(models)
+        cols['input_tokens'].extend(input_tokens.tolist())
+        cols['output_tokens'].extend(output_tokens.tolist())
+        cols['cost'].extend(costs.tolist())
+        cols['experiment_id'].extend(
+            experiment_ids if experiment_ids is not None else [None] * n
+        )
+        cols['duration_seconds'].extend(
+            durations_seconds if durations_seconds is not None else [None] * n
+        )
+
+        self._df_cache = None
+
+        self.logger.debug(
+            "Logged %d API calls in batch | total cost: $%.4f", n, costs.sum()
+        )
+
+        return costs
+
     def _calculate_cost(
         self,
         model: str,
@@ -177,9 +374,8 @@ class CostTracker:
             self.logger.warning(
                 f"Model '{model}' not in pricing table. Using default pricing."
             )
-            # Use average pricing as fallback
-            input_price = 3.00 / 1_000_000
-            output_price = 15.00 / 1_000_000
+            input_price = self.FALLBACK_INPUT_PRICE
+            output_price = self.FALLBACK_OUTPUT_PRICE
         else:
             input_price = self.pricing[model]["input"]
             output_price = self.pricing[model]["output"]
@@ -194,7 +390,7 @@ class CostTracker:
         Returns:
             Total cost in USD
         """
-        return sum(call.cost for call in self.calls)
+        return float(np.sum(np.frombuffer(self._columns['cost'], dtype=np.float64)))
 
     def get_total_tokens(self) -> Dict[str, int]:
         """
@@ -203,8 +399,12 @@ class CostTracker:
         Returns:
             Dictionary with 'input', 'output', and 'total' token counts
         """
-        input_total = sum(call.input_tokens for call in self.calls)
-        output_total = sum(call.output_tokens for call in self.calls)
+        input_total = int(np.sum(
+            np.frombuffer(self._columns['input_tokens'], dtype=np.int64)
+        ))
+        output_total = int(np.sum(
+            np.frombuffer(self._columns['output_tokens'], dtype=np.int64)
+        ))
 
         return {
             "input": input_total,
@@ -212,6 +412,24 @@ class CostTracker:
             "total": input_total + output_total,
         }
 
+    def _aggregation_df(self) -> pd.DataFrame:
+        """
+        Get the call log as a DataFrame for vectorized aggregation.
+
+        The frame is cached and rebuilt only after new calls are logged,
+        so repeated breakdowns don't re-scan the per-field storage.
+
+        Returns:
+            DataFrame with agent, experiment_id, and cost columns
+        """
+        if self._df_cache is None:
+            self._df_cache = pd.DataFrame({
+                'agent': self._columns['agent'],
+                'experiment_id': self._columns['experiment_id'],
+                'cost': np.frombuffer(self._columns['cost'], dtype=np.float64),
+            })
+        return self._df_cache
+
     def get_cost_by_agent(self) -> Dict[str, float]:
         """
         Get cost breakdown by agent.
@@ -219,14 +437,11 @@ class CostTracker:
         Returns:
             Dictionary mapping agent names to their total costs
         """
-        costs_by_agent = {}
+        if not self.num_calls:
+            return {}
 
-        for call in self.calls:
-            if call.agent not in costs_by_agent:
-                costs_by_agent[call.agent] = 0.0
-            costs_by_agent[call.agent] += call.cost
-
-        return costs_by_agent
+        df = self._aggregation_df()
+        return df.groupby('agent', sort=False)['cost'].sum().to_dict()
 
     def get_cost_by_experiment(self) -> Dict[str, float]:
         """
@@ -235,15 +450,14 @@ class CostTracker:
         Returns:
             Dictionary mapping experiment IDs to their total costs
         """
-        costs_by_experiment = {}
-
-        for call in self.calls:
-            exp_id = call.experiment_id or "unknown"
-            if exp_id not in costs_by_experiment:
-                costs_by_experiment[exp_id] = 0.0
-            costs_by_experiment[exp_id] += call.cost
+        if not self.num_calls:
+            return {}
 
-        return costs_by_experiment
+        df = self._aggregation_df()
+        grouped = df['cost'].groupby(
+            df['experiment_id'].fillna("unknown"), sort=False
+        )
+        return grouped.sum().to_dict()
 
     def generate_report(self) -> pd.DataFrame:
         """
@@ -252,11 +466,24 @@ class CostTracker:
         Returns:
             Pandas DataFrame with all API call details
         """
-        if not self.calls:
+        if not self.num_calls:
             return pd.DataFrame()
 
-        data = [asdict(call) for call in self.calls]
-        df = pd.DataFrame(data)
+        cols = self._columns
+        df = pd.DataFrame({
+            # time_ns is UTC-based; shift to naive local time so the
+            # report matches the datetime.now() values it used to store
+            'timestamp': pd.to_datetime(
+                np.frombuffer(cols['timestamp_ns'], dtype=np.int64), unit='ns'
+            ).tz_localize('UTC').tz_convert(_LOCAL_TZ).tz_localize(None),
+            'experiment_id': cols['experiment_id'],
+            'agent': cols['agent'],
+            'model': cols['model'],
+            'input_tokens': np.frombuffer(cols['input_tokens'], dtype=np.int64),
+            'output_tokens': np.frombuffer(cols['output_tokens'], dtype=np.int64),
+            'cost': np.frombuffer(cols['cost'], dtype=np.float64),
+            'duration_seconds': cols['duration_seconds'],
+        })
 
         # Format timestamp
         df['date'] = df['timestamp'].dt.date
@@ -282,6 +509,25 @@ class CostTracker:
         df.to_csv(filepath, index=False)
         self.logger.info(f"Cost report saved to: {filepath}")
 
+    def save_report_parquet(self, filepath: str) -> None:
+        """
+        Save cost report to a compressed Parquet file.
+
+        Columnar and compressed, so it writes and loads back much faster
+        than CSV and supports column pruning on read, e.g.
+        pd.read_parquet(filepath, columns=['agent', 'cost']).
+
+        Args:
+            filepath: Path to save the Parquet file
+        """
+        df = self.generate_report()
+        if not df.empty:
+            # date/time are plain Python objects; Parquet needs them typed
+            df['date'] = pd.to_datetime(df['date'])
+            df['time'] = df['time'].astype(str)
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd')
+        self.logger.info(f"Cost report saved to: {filepath}")
+
     def get_summary(self) -> Dict:
         """
         Get a summary of costs and usage.
@@ -289,7 +535,7 @@ class CostTracker:
         Returns:
             Dictionary with summary statistics
         """
-        if not self.calls:
+        if not self.num_calls:
             return {
                 "total_calls": 0,
                 "total_cost": 0.0,
@@ -299,12 +545,12 @@ class CostTracker:
             }
 
         return {
-            "total_calls": len(self.calls),
+            "total_calls": self.num_calls,
             "total_cost": self.get_total_cost(),
             "total_tokens": self.get_total_tokens(),
             "cost_by_agent": self.get_cost_by_agent(),
             "cost_by_experiment": self.get_cost_by_experiment(),
-            "average_cost_per_call": self.get_total_cost() / len(self.calls),
+            "average_cost_per_call": self.get_total_cost() / self.num_calls,
         }
 
     def print_summary(self) -> None:
@@ -336,5 +582,6 @@ class CostTracker:
 
     def clear(self) -> None:
         """Clear all logged calls."""
-        self.calls = []
+        self._columns = self._empty_columns()
+        self._df_cache = None
         self.logger.info("Cost tracker cleared")
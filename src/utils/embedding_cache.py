@@ -0,0 +1,101 @@
+"""
+Persistent embedding cache.
+
+This module provides SQLite-backed storage of sentence embeddings so that
+vectors computed in one process are reused across server restarts.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of sentence embeddings.
+
+    Entries are keyed by the SHA-256 digest of the model name plus text,
+    so raw text is never stored. Vectors are quantized to int8 with a
+    per-vector scale, cutting disk size 4x versus float32 while staying
+    accurate to ~3 decimal places on normalized embeddings.
+
+    Example:
+        >>> cache = EmbeddingCache()
+        >>> cache.put("hello", "all-MiniLM-L6-v2", embedding)
+        >>> cache.get("hello", "all-MiniLM-L6-v2")
+        array([...], dtype=float32)
+    """
+
+    def __init__(self, db_path: str = ".cache/embeddings.db"):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, scale REAL NOT NULL, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(text: str, model_name: str) -> str:
+        """Build the SHA-256 digest key for a (text, model) pair."""
+        return hashlib.sha256(
+            f"{model_name}\x00{text}".encode('utf-8')
+        ).hexdigest()
+
+    def get(self, text: str, model_name: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            text: The embedded text
+            model_name: Model the embedding was computed with
+
+        Returns:
+            Dequantized float32 vector, or None on a miss
+        """
+        row = self._conn.execute(
+            "SELECT scale, vec FROM embeddings WHERE key = ?",
+            (self._key(text, model_name),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        scale, blob = row
+        return np.frombuffer(blob, dtype=np.int8).astype(np.float32) * scale
+
+    def put(self, text: str, model_name: str, vec: np.ndarray) -> None:
+        """
+        Store an embedding.
+
+        Args:
+            text: The embedded text
+            model_name: Model the embedding was computed with
+            vec: Embedding vector (quantized to int8 on write)
+        """
+        vec = np.asarray(vec, dtype=np.float32)
+        scale = float(np.abs(vec).max()) / 127.0 or 1.0
+        quantized = np.round(vec / scale).astype(np.int8)
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO embeddings (key, scale, vec) "
+            "VALUES (?, ?, ?)",
+            (self._key(text, model_name), scale, quantized.tobytes())
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
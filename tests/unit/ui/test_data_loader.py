@@ -5,6 +5,8 @@ Unit tests for data loader module.
 import pytest
 import json
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 from src.ui.data_loader import DataLoader
 
@@ -17,9 +19,9 @@ class TestDataLoader:
         """Create DataLoader instance."""
         return DataLoader()
 
-    @pytest.fixture
-    def sample_input(self, tmp_path):
-        """Create sample input file."""
+    @pytest.fixture(scope="session")
+    def sample_input(self, tmp_path_factory):
+        """Create sample input file (once per session)."""
         data = {
             'sentences': [
                 {
@@ -36,15 +38,15 @@ class TestDataLoader:
             }
         }
 
-        file_path = tmp_path / "test_input.json"
+        file_path = tmp_path_factory.mktemp("data") / "test_input.json"
         with open(file_path, 'w') as f:
             json.dump(data, f)
 
         return file_path
 
-    @pytest.fixture
-    def sample_results(self, tmp_path):
-        """Create sample results file."""
+    @pytest.fixture(scope="session")
+    def sample_results(self, tmp_path_factory):
+        """Create sample results file (once per session)."""
         data = {
             'experiment_id': 'test_exp',
             'timestamp': '2025-11-23T12:00:00',
@@ -57,23 +59,50 @@ class TestDataLoader:
             ]
         }
 
-        file_path = tmp_path / "test_results.json"
+        file_path = tmp_path_factory.mktemp("data") / "test_results.json"
         with open(file_path, 'w') as f:
             json.dump(data, f)
 
         return file_path
 
-    @pytest.fixture
-    def sample_metrics(self, tmp_path):
-        """Create sample metrics CSV."""
+    @pytest.fixture(scope="session")
+    def sample_results_ndjson(self, tmp_path_factory):
+        """Create sample results NDJSON file (once per session)."""
+        rows = [
+            {
+                'experiment_id': 'test_exp',
+                'timestamp': '2025-11-23T12:00:00',
+                'original': 'The quick brown fox',
+                'final': 'The fast brown fox',
+                'error_rate': 0.15
+            },
+            {
+                'experiment_id': 'test_exp',
+                'timestamp': '2025-11-23T12:00:00',
+                'original': 'Jumps over the dog',
+                'final': 'Leaps over the dog',
+                'error_rate': 0.3
+            }
+        ]
+
+        file_path = tmp_path_factory.mktemp("data") / "test_results.jsonl"
+        with open(file_path, 'w') as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+
+        return file_path
+
+    @pytest.fixture(scope="session")
+    def sample_metrics(self, tmp_path_factory):
+        """Create sample metrics CSV (once per session)."""
         df = pd.DataFrame({
             'error_rate': [0.0, 0.1, 0.2],
             'cosine_distance': [0.0, 0.1, 0.2],
             'euclidean_distance': [0.0, 0.5, 1.0]
         })
 
-        file_path = tmp_path / "metrics.csv"
-        df.to_csv(file_path, index=False)
+        file_path = tmp_path_factory.mktemp("data") / "metrics.csv"
+        pacsv.write_csv(pa.Table.from_pandas(df), str(file_path))
 
         return file_path
 
@@ -131,6 +160,16 @@ class TestDataLoader:
         with pytest.raises(ValueError, match="missing 'results' key"):
             loader.load_results(str(invalid_file))
 
+    def test_load_results_ndjson(self, loader, sample_results_ndjson):
+        """Test line-delimited results loading."""
+        df, meta = loader.load_results_ndjson(str(sample_results_ndjson))
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 2
+        assert 'error_rate' in df.columns
+        assert meta['experiment_id'] == 'test_exp'
+        assert 'experiment_id' not in df.columns
+
     def test_load_metrics_success(self, loader, sample_metrics):
         """Test successful metrics loading."""
         df = loader.load_metrics(str(sample_metrics))
@@ -154,6 +193,14 @@ class TestDataLoader:
         assert summary['total_sentences'] == 1
         assert summary['mode'] == 'unknown'
 
+    def test_load_results_summary(self, loader, sample_results):
+        """Test summary-only loading without caching the payload."""
+        summary = loader.load_results_summary(str(sample_results))
+
+        assert summary['experiment_id'] == 'test_exp'
+        assert summary['num_sentences'] == 1
+        assert f"results_{sample_results}" not in loader._cache
+
     def test_get_result_summary_empty(self, loader):
         """Test summary for empty results."""
         results = {'results': []}
@@ -4,6 +4,7 @@ Unit tests for visualization module.
 
 import pytest
 import pandas as pd
+import pyarrow as pa
 import plotly.graph_objects as go
 from src.ui.visualization import InteractiveVisualizer
 
@@ -16,26 +17,34 @@ class TestInteractiveVisualizer:
         """Create InteractiveVisualizer instance."""
         return InteractiveVisualizer()
 
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample data for testing."""
-        return pd.DataFrame({
+    @pytest.fixture(scope="session")
+    def sample_table(self):
+        """Create sample data once per session as an Arrow table."""
+        return pa.table({
             'error_rate': [0.0, 0.1, 0.2, 0.3, 0.4, 0.5],
             'cosine_distance': [0.0, 0.05, 0.12, 0.20, 0.30, 0.45],
             'euclidean_distance': [0.0, 0.5, 1.0, 1.5, 2.0, 2.5],
             'manhattan_distance': [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
         })
 
+    @pytest.fixture
+    def sample_data(self, sample_table):
+        """Fresh DataFrame view of the shared table per test."""
+        return sample_table.to_pandas()
+
     def test_init(self, visualizer):
         """Test visualizer initialization."""
         assert visualizer is not None
-        assert isinstance(visualizer.default_colors, list)
+        assert isinstance(visualizer.default_colors, (list, tuple))
 
-    def test_plot_error_vs_distance(self, visualizer, sample_data):
+    @pytest.mark.parametrize(
+        'metric', ['cosine_distance', 'euclidean_distance', 'manhattan_distance']
+    )
+    def test_plot_error_vs_distance(self, visualizer, sample_data, metric):
         """Test error vs distance plot generation."""
         fig = visualizer.plot_error_vs_distance(
             df=sample_data,
-            metric='cosine_distance',
+            metric=metric,
             title='Test Plot'
         )
 
@@ -106,27 +115,20 @@ class TestInteractiveVisualizer:
         assert len(fig.data) == 1
         assert fig.layout.title.text == 'Distribution Test'
 
-    def test_create_dashboard(self, visualizer, sample_data):
-        """Test dashboard creation."""
+    @pytest.mark.parametrize(
+        'metric', ['cosine_distance', 'euclidean_distance']
+    )
+    def test_create_dashboard(self, visualizer, sample_data, metric):
+        """Test dashboard creation for each metric."""
         fig = visualizer.create_dashboard(
             df=sample_data,
-            metric='cosine_distance'
+            metric=metric
         )
 
         assert isinstance(fig, go.Figure)
         # Dashboard has 4 subplots
         assert len(fig.data) >= 4
 
-    def test_create_dashboard_custom_metric(self, visualizer, sample_data):
-        """Test dashboard with different metric."""
-        fig = visualizer.create_dashboard(
-            df=sample_data,
-            metric='euclidean_distance'
-        )
-
-        assert isinstance(fig, go.Figure)
-        assert len(fig.data) >= 4
-
     def test_plot_with_empty_dataframe(self, visualizer):
         """Test plotting with empty DataFrame."""
         empty_df = pd.DataFrame()